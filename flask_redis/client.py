@@ -1,5 +1,8 @@
-import ssl
-from urllib.parse import parse_qs, unquote, urlparse
+import functools
+import re
+import sys
+from collections import namedtuple
+from urllib.parse import unquote
 
 try:
     import redis
@@ -10,7 +13,194 @@ except ImportError:
     Sentinel = None
 
 
+# Flat parse result for a sentinel URL; ssl and auth are kwargs dicts
+# for the Sentinel / master_for calls, or None when empty so the
+# common non-TLS, no-auth case allocates nothing.
+_SentinelCfg = namedtuple(
+    "_SentinelCfg", "hosts master_name db socket_timeout ssl auth"
+)
+
+# Built lazily on first use so importing flask_redis does not pull in
+# the ssl module for plain redis:// users.
+_SSL_CERT_REQS = None
+
+# Sentinel URL prefixes that route init_app to the sentinel path
+# (startswith needs a tuple, so no frozenset here).
+_SENTINEL_URL_PREFIXES = ("redis+sentinel://", "rediss+sentinel://")
+
+# One C-level scan for the whole sentinel URL shape: userinfo (split on
+# the last '@', so raw '@' stays in the password), hosts, path, query.
+_SENTINEL_RE = re.compile(
+    r"^rediss?\+sentinel://"
+    r"(?:([^:@/?]*)(?::([^/?]*))?@)?"  # username, password
+    r"([^/?]*)"  # host list
+    r"(?:/([^?]*))?"  # path: master[/db]
+    r"(?:\?(.*))?$"  # query
+)
+
+# Interned query-parameter keys: one canonical spelling per parameter,
+# and comparisons against them take the identity fast path when possible.
+_KEY_SOCKET_TIMEOUT = sys.intern("socket_timeout")
+_KEY_SSL = sys.intern("ssl")
+_KEY_SSL_CERT_REQS = sys.intern("ssl_cert_reqs")
+_KEY_SSL_KEYFILE = sys.intern("ssl_keyfile")
+_KEY_SSL_CERTFILE = sys.intern("ssl_certfile")
+_KEY_SSL_CA_CERTS = sys.intern("ssl_ca_certs")
+
+# Frequently used client methods bound directly onto the instance after
+# init so calls resolve via __dict__ instead of the __getattr__ fallback.
+_FORWARDED_METHODS = (
+    "get",
+    "set",
+    "delete",
+    "exists",
+    "expire",
+    "incr",
+    "decr",
+    "hget",
+    "hset",
+    "hgetall",
+    "lpush",
+    "rpush",
+    "lpop",
+    "rpop",
+    "sadd",
+    "smembers",
+    "publish",
+    "pipeline",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_redis_url(redis_url):
+    """Parse a Redis URL into a _SentinelCfg, or None.
+
+    Memoized on the raw URL string so repeated init_app calls with the
+    same URL (multiple instances, tests) only pay the parsing cost once.
+    Returns None for non-sentinel schemes: the standard path hands the
+    raw URL to the provider's from_url, so a cheap prefix check is all
+    the dispatch needs.
+
+    The sentinel URL is decomposed in a single pass: one precompiled
+    regex match for userinfo/hosts/path/query, then one loop over the
+    query pairs dispatching into locals.
+    """
+    if not redis_url.startswith(_SENTINEL_URL_PREFIXES):
+        return None
+
+    ssl_enabled = redis_url.startswith("rediss")
+
+    username, password, hosts_part, path, query = _SENTINEL_RE.match(
+        redis_url
+    ).groups()
+    path = path or ""
+    query = query or ""
+
+    auth_params = None
+    if username:
+        auth_params = {"username": unquote(username)}
+    if password:
+        if auth_params is None:
+            auth_params = {}
+        auth_params["password"] = unquote(password)
+
+    hosts = []
+    for host_port in hosts_part.split(","):
+        idx = host_port.rfind(":")
+        if idx == -1:
+            hosts.append((host_port, 26379))  # Default Sentinel port
+        else:
+            hosts.append((host_port[:idx], int(host_port[idx + 1 :])))
+
+    master_name, sep, db_part = path.partition("/")
+    db = int(db_part) if sep else 0  # Default DB
+
+    socket_timeout = None
+    ssl_cert_reqs = ssl_keyfile = ssl_certfile = ssl_ca_certs = None
+    has_ssl_opts = False
+    if query:
+        for pair in query.split("&"):
+            eq = pair.find("=")
+            if eq == -1:
+                continue
+            key = pair[:eq]
+            value = pair[eq + 1 :]
+            if key == _KEY_SOCKET_TIMEOUT:
+                socket_timeout = float(value)
+            elif key == _KEY_SSL:
+                ssl_enabled = ssl_enabled or value.lower() == "true"
+            elif key == _KEY_SSL_CERT_REQS:
+                ssl_cert_reqs = _parse_ssl_cert_reqs(value)
+                has_ssl_opts = True
+            elif key == _KEY_SSL_KEYFILE:
+                # Only the file-path parameters may carry percent-encoding.
+                ssl_keyfile = unquote(value)
+                has_ssl_opts = True
+            elif key == _KEY_SSL_CERTFILE:
+                ssl_certfile = unquote(value)
+                has_ssl_opts = True
+            elif key == _KEY_SSL_CA_CERTS:
+                ssl_ca_certs = unquote(value)
+                has_ssl_opts = True
+
+    if not ssl_enabled:
+        ssl_params = None
+    elif not has_ssl_opts:
+        # Plain rediss+sentinel:// with no cert options: nothing to probe.
+        ssl_params = {"ssl": True}
+    else:
+        ssl_params = {"ssl": True}
+        if ssl_cert_reqs is not None:
+            ssl_params["ssl_cert_reqs"] = ssl_cert_reqs
+        if ssl_keyfile:
+            ssl_params["ssl_keyfile"] = ssl_keyfile
+        if ssl_certfile:
+            ssl_params["ssl_certfile"] = ssl_certfile
+        if ssl_ca_certs:
+            ssl_params["ssl_ca_certs"] = ssl_ca_certs
+
+    return _SentinelCfg(
+        hosts=hosts,
+        master_name=master_name,
+        db=db,
+        socket_timeout=socket_timeout,
+        ssl=ssl_params,
+        auth=auth_params,
+    )
+
+
+def _parse_ssl_cert_reqs(value):
+    if not value:
+        return None
+    global _SSL_CERT_REQS
+    if _SSL_CERT_REQS is None:
+        import ssl
+
+        _SSL_CERT_REQS = {
+            "required": ssl.CERT_REQUIRED,
+            "optional": ssl.CERT_OPTIONAL,
+            "none": ssl.CERT_NONE,
+        }
+    return _SSL_CERT_REQS.get(value.lower())
+
+
 class FlaskRedis(object):
+    # Slots cover the core state plus every attribute bound at init
+    # (forwarded methods, hmset shim, cached subscript dunders); the
+    # __getattr__ fallback still works for everything else.
+    __slots__ = (
+        "_redis_client",
+        "provider_class",
+        "config_prefix",
+        "decode_responses",
+        "provider_kwargs",
+        "_final_kwargs",
+        "hmset",
+        "_getitem",
+        "_setitem",
+        "_delitem",
+    ) + _FORWARDED_METHODS
+
     def __init__(
         self,
         app=None,
@@ -43,15 +233,16 @@ class FlaskRedis(object):
             f"{self.config_prefix}_URL", "redis://localhost:6379/0"
         )
 
-        self.provider_kwargs.update(kwargs)
+        # Merge into a fresh dict instead of mutating provider_kwargs so
+        # repeated init_app calls stay idempotent.
+        self._final_kwargs = {**self.provider_kwargs, **kwargs}
 
-        parsed_url = urlparse(redis_url)
-        scheme = parsed_url.scheme
+        sentinel_cfg = _parse_redis_url(redis_url)
 
-        if scheme in ["redis+sentinel", "rediss+sentinel"]:
+        if sentinel_cfg is not None:
             if Sentinel is None:
                 raise ImportError("redis-py must be installed to use Redis Sentinel.")
-            self._init_sentinel_client(parsed_url)
+            self._init_sentinel_client(sentinel_cfg)
         else:
             self._init_standard_client(redis_url)
 
@@ -61,154 +252,64 @@ class FlaskRedis(object):
 
     def _init_standard_client(self, redis_url):
         self._redis_client = self.provider_class.from_url(
-            redis_url, decode_responses=self.decode_responses, **self.provider_kwargs
-        )
-
-    def _init_sentinel_client(self, parsed_url):
-        sentinel_kwargs, client_kwargs = self._parse_sentinel_parameters(parsed_url)
-
-        sentinel = Sentinel(
-            sentinel_kwargs["hosts"],
-            socket_timeout=sentinel_kwargs["socket_timeout"],
-            **sentinel_kwargs["ssl_params"],
-            **sentinel_kwargs["auth_params"],
-            **self.provider_kwargs,
+            redis_url, decode_responses=self.decode_responses, **self._final_kwargs
         )
+        self._bind_client_methods()
+
+    def _init_sentinel_client(self, cfg):
+        # Compose the shared call kwargs once instead of splatting the
+        # same dicts through both call sites; the ssl/auth entries are
+        # None (not empty dicts) in the common non-TLS, no-auth case.
+        sentinel_call_kwargs = {}
+        if cfg.ssl is not None:
+            sentinel_call_kwargs.update(cfg.ssl)
+        if cfg.auth is not None:
+            sentinel_call_kwargs.update(cfg.auth)
+        sentinel_call_kwargs.update(self._final_kwargs)
+        sentinel_call_kwargs["socket_timeout"] = cfg.socket_timeout
+
+        sentinel = Sentinel(cfg.hosts, **sentinel_call_kwargs)
 
         self._redis_client = sentinel.master_for(
-            sentinel_kwargs["master_name"],
-            db=client_kwargs["db"],
-            socket_timeout=client_kwargs["socket_timeout"],
+            cfg.master_name,
+            db=cfg.db,
             decode_responses=self.decode_responses,
-            **client_kwargs["ssl_params"],
-            **client_kwargs["auth_params"],
-            **self.provider_kwargs,
+            **sentinel_call_kwargs,
         )
-
-    def _parse_sentinel_parameters(self, parsed_url):
-        username, password = self._extract_credentials(parsed_url)
-        hosts = self._parse_hosts(parsed_url)
-        master_name, db = self._parse_master_and_db(parsed_url)
-        query_params = parse_qs(parsed_url.query)
-
-        socket_timeout = self._parse_socket_timeout(query_params)
-        ssl_enabled = self._parse_ssl_enabled(parsed_url.scheme, query_params)
-        ssl_params = self._parse_ssl_params(query_params, ssl_enabled)
-        auth_params = self._parse_auth_params(username, password)
-
-        sentinel_kwargs = {
-            "hosts": hosts,
-            "socket_timeout": socket_timeout,
-            "ssl_params": ssl_params,
-            "auth_params": auth_params,
-            "master_name": master_name,
-        }
-
-        client_kwargs = {
-            "db": db,
-            "socket_timeout": socket_timeout,
-            "ssl_params": ssl_params,
-            "auth_params": auth_params,
-        }
-
-        return sentinel_kwargs, client_kwargs
-
-    def _extract_credentials(self, parsed_url):
-        username = parsed_url.username
-        password = parsed_url.password
-        return username, password
-
-    def _parse_hosts(self, parsed_url):
-        netloc = parsed_url.netloc
-        if "@" in netloc:
-            hosts_part = netloc.split("@", 1)[1]
-        else:
-            hosts_part = netloc
-
-        hosts = []
-        for host_port in hosts_part.split(","):
-            if ":" in host_port:
-                host, port = host_port.split(":", 1)
-                port = int(port)
-            else:
-                host = host_port
-                port = 26379  # Default Sentinel port
-            hosts.append((host, port))
-        return hosts
-
-    def _parse_master_and_db(self, parsed_url):
-        path = parsed_url.path.lstrip("/")
-        if "/" in path:
-            master_name, db_part = path.split("/", 1)
-            db = int(db_part)
-        else:
-            master_name = path
-            db = 0  # Default DB
-        return master_name, db
-
-    def _parse_socket_timeout(self, query_params):
-        socket_timeout = query_params.get("socket_timeout", [None])[0]
-        if socket_timeout is not None:
-            return float(socket_timeout)
-        return None
-
-    def _parse_ssl_enabled(self, scheme, query_params):
-        if scheme == "rediss+sentinel":
-            return True
-        ssl_param = query_params.get("ssl", ["False"])[0].lower()
-        return ssl_param == "true"
-
-    def _parse_ssl_params(self, query_params, ssl_enabled):
-        ssl_params = {}
-        if ssl_enabled:
-            ssl_cert_reqs = self._parse_ssl_cert_reqs(query_params)
-            ssl_keyfile = query_params.get("ssl_keyfile", [None])[0]
-            ssl_certfile = query_params.get("ssl_certfile", [None])[0]
-            ssl_ca_certs = query_params.get("ssl_ca_certs", [None])[0]
-
-            ssl_params = {"ssl": True}
-            if ssl_cert_reqs is not None:
-                ssl_params["ssl_cert_reqs"] = ssl_cert_reqs
-            if ssl_keyfile:
-                ssl_params["ssl_keyfile"] = ssl_keyfile
-            if ssl_certfile:
-                ssl_params["ssl_certfile"] = ssl_certfile
-            if ssl_ca_certs:
-                ssl_params["ssl_ca_certs"] = ssl_ca_certs
-        return ssl_params
-
-    def _parse_ssl_cert_reqs(self, query_params):
-        ssl_cert_reqs = query_params.get("ssl_cert_reqs", [None])[0]
-        if ssl_cert_reqs:
-            ssl_cert_reqs = ssl_cert_reqs.lower()
-            return {
-                "required": ssl.CERT_REQUIRED,
-                "optional": ssl.CERT_OPTIONAL,
-                "none": ssl.CERT_NONE,
-            }.get(ssl_cert_reqs)
-        return None
-
-    def _parse_auth_params(self, username, password):
-        auth_params = {}
-        if username:
-            auth_params["username"] = username
-        if password:
-            auth_params["password"] = password
-        return auth_params
-
-    def hmset(self, name, mapping):
-        # Implement hmset for compatibility
-        # Use hset with mapping parameter
-        return self._redis_client.hset(name, mapping=mapping)
+        self._bind_client_methods()
+
+    def _bind_client_methods(self):
+        # Shortcut attribute resolution for hot commands: a bound method
+        # in the instance __dict__ skips the __getattr__ fallback, which
+        # stays in place for everything else.
+        client = self._redis_client
+        for name in _FORWARDED_METHODS:
+            method = getattr(client, name, None)
+            if method is not None:
+                setattr(self, name, method)
+
+        # hmset compatibility shim: hset with a mapping parameter, bound
+        # as a closure so calls skip the method-lookup chain entirely.
+        hset = getattr(client, "hset", None)
+        if hset is not None:
+            self.hmset = lambda name, mapping, _hset=hset: _hset(
+                name, mapping=mapping
+            )
+
+        # Cache the subscript dunders so __getitem__ and friends save a
+        # LOAD_ATTR on _redis_client per call.
+        self._getitem = getattr(client, "__getitem__", None)
+        self._setitem = getattr(client, "__setitem__", None)
+        self._delitem = getattr(client, "__delitem__", None)
 
     def __getattr__(self, name):
         return getattr(self._redis_client, name)
 
     def __getitem__(self, name):
-        return self._redis_client[name]
+        return self._getitem(name)
 
     def __setitem__(self, name, value):
-        self._redis_client[name] = value
+        self._setitem(name, value)
 
     def __delitem__(self, name):
-        del self._redis_client[name]
+        self._delitem(name)